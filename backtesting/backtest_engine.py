@@ -1,12 +1,26 @@
 import os
 import datetime  # type: ignore
+import functools
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import matplotlib  # type: ignore
+matplotlib.use('Agg')  # Non-interactive backend; plots are only saved to disk
 
 from core.brokerage_client import BrokerageClient
 from config.config import INTRADAY_TARGET_STOCK
 from strategies.macd_strategy import MACDStrategy
 
+try:
+    import pyarrow  # type: ignore  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+CSV_ENGINE = 'pyarrow' if PARQUET_AVAILABLE else 'c'
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,6 +28,7 @@ logger = logging.getLogger(__name__)
 STOCK_DATA_FOLDER = "stock_data"
 REPORT_DUMP_FOLDER = "backtesting/report_dump"
 DAYS = 60
+PARQUET_COMPRESSION = "zstd"
 
 # Timeframe configurations
 TIMEFRAMES = {
@@ -25,13 +40,33 @@ TIMEFRAMES = {
     "1d": {"resample_factor": None, "description": "1 Day"}
 }
 
+# Create the data and report folders once, when the engine is imported
+os.makedirs(STOCK_DATA_FOLDER, exist_ok=True)
+os.makedirs(REPORT_DUMP_FOLDER, exist_ok=True)
+
+# Aggregation applied to every OHLCV column when building larger bars
+OHLCV_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
 
-def ensure_data_folder():
-    os.makedirs(STOCK_DATA_FOLDER, exist_ok=True)
+# Cached listing of STOCK_DATA_FOLDER, refreshed when the folder's mtime changes
+_stock_data_listing = {"mtime": None, "names": frozenset()}
 
+# Resampling bins per input row above which data is treated as sparse
+SPARSE_BIN_RATIO = 100
 
-def ensure_report_dump_folder():
-    os.makedirs(REPORT_DUMP_FOLDER, exist_ok=True)
+# open/high/low are stored as float32 to halve memory and bytes moved; close stays
+# float64 because trade prices and P&L are taken from it and must not drift
+PRICE_DTYPES = {
+    'open': 'float32',
+    'high': 'float32',
+    'low': 'float32',
+    'close': 'float64'
+}
 
 
 def fetch_historical_data(brokerage_client, symbol, exchange, timeframe="1min"):
@@ -65,12 +100,16 @@ def fetch_historical_data(brokerage_client, symbol, exchange, timeframe="1min"):
         return df
     
     file_path = os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_{timeframe}_historical.csv")
-    df.to_csv(file_path, index=False)
+    if PARQUET_AVAILABLE:
+        file_path = _parquet_path(file_path)
+        df.to_parquet(file_path, engine='pyarrow', compression=PARQUET_COMPRESSION)
+    else:
+        df.to_csv(file_path)
     logger.info(f"Saved {len(df)} records to {file_path}")
     return df
 
 
-def apply_strategies(df, symbol, exchange, timeframe, quantity=100):
+def apply_strategies(df, symbol, exchange, timeframe, quantity=100, io_executor=None):
     """
     Apply MACD strategy to the given data.
     
@@ -80,6 +119,9 @@ def apply_strategies(df, symbol, exchange, timeframe, quantity=100):
         exchange: Exchange name
         timeframe: Timeframe description
         quantity: Number of shares to trade
+        io_executor: Optional executor for writing the plot and signals CSV in
+                     the background. The caller must wait for it (e.g. by leaving
+                     its ``with`` block) before relying on the report files.
         
     Returns:
         Tuple of (trades_df, total_profit, strategy_stats)
@@ -91,13 +133,19 @@ def apply_strategies(df, symbol, exchange, timeframe, quantity=100):
         trades_df, total_profit = macd_strategy.calculate_profit()
         strategy_stats = macd_strategy.get_strategy_stats()
         
-        # Save plot for this timeframe
         plot_path = os.path.join(REPORT_DUMP_FOLDER, f"macd_{symbol}_{timeframe.replace(' ', '_')}_signals.png")
-        macd_strategy.plot_signals(save_path=plot_path, show_plot=False)
-        
-        # Save signals to CSV
         signals_path = os.path.join(REPORT_DUMP_FOLDER, f"macd_{symbol}_{timeframe.replace(' ', '_')}_signals.csv")
-        macd_strategy.save_signals_to_csv(signals_path)
+        
+        if io_executor is None:
+            macd_strategy.plot_signals(save_path=plot_path, show_plot=False)
+            macd_strategy.save_signals_to_csv(signals_path)
+        else:
+            # Plot rendering and CSV writing overlap each other and the caller
+            for future in (
+                io_executor.submit(macd_strategy.plot_signals, save_path=plot_path, show_plot=False),
+                io_executor.submit(macd_strategy.save_signals_to_csv, signals_path),
+            ):
+                future.add_done_callback(_log_report_failure)
         
         return trades_df, total_profit, strategy_stats
         
@@ -106,6 +154,13 @@ def apply_strategies(df, symbol, exchange, timeframe, quantity=100):
         return pd.DataFrame(), 0.0, {}
 
 
+def _log_report_failure(future):
+    """Log an exception raised by a background report-writing task."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to write strategy report: {error}")
+
+
 def resample_data(df, timeframe_key):
     """
     Resample 1-minute data to the desired timeframe.
@@ -125,28 +180,16 @@ def resample_data(df, timeframe_key):
     # For daily data, use different resampling
     if config["resample_factor"] is None:
         # Resample to daily bars
-        df_resampled = df.resample('D').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }).dropna()
+        df_resampled = _resample_from_base(df, 'D')
     else:
         # Resample to custom minute intervals
-        df_resampled = df.resample(f'{config["resample_factor"]}T').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }).dropna()
+        df_resampled = _resample_from_base(df, f'{config["resample_factor"]}min')
     
     logger.info(f"Resampled data from {len(df)} to {len(df_resampled)} bars for {config['description']}")
     return df_resampled
 
 
-def load_local_data(symbol, exchange, timeframe="1m"):
+def load_local_data(symbol, exchange, timeframe="1m", base_df=None):
     """
     Load local historical data from CSV file.
     
@@ -159,13 +202,15 @@ def load_local_data(symbol, exchange, timeframe="1m"):
         symbol: Trading symbol
         exchange: Exchange name
         timeframe: Timeframe of the data (e.g., "1m", "30m", "1d")
+        base_df: Already loaded 1-minute data to aggregate from. If None, the
+                 1m file is loaded on demand.
         
     Returns:
         pd.DataFrame: Historical data or None if not found
     """
     # Step 1: Try exact timeframe match first
     exact_path = os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_{timeframe}.csv")
-    if os.path.exists(exact_path):
+    if _data_file_exists(exact_path):
         logger.info(f"Found exact timeframe file: {exact_path}")
         return _load_csv_file(exact_path)
     
@@ -173,15 +218,15 @@ def load_local_data(symbol, exchange, timeframe="1m"):
     
     # Step 2: Try to aggregate from smaller timeframes
     if timeframe == "10m":
-        return _aggregate_to_10m(symbol, exchange)
+        return _aggregate_to_10m(symbol, exchange, base_df)
     elif timeframe == "30m":
-        return _aggregate_to_30m(symbol, exchange)
+        return _aggregate_to_30m(symbol, exchange, base_df)
     elif timeframe == "1h":
-        return _aggregate_to_1h(symbol, exchange)
+        return _aggregate_to_1h(symbol, exchange, base_df)
     elif timeframe == "3h":
-        return _aggregate_to_3h(symbol, exchange)
+        return _aggregate_to_3h(symbol, exchange, base_df)
     elif timeframe == "1d":
-        return _aggregate_to_1d(symbol, exchange)
+        return _aggregate_to_1d(symbol, exchange, base_df)
     else:
         # Fallback to old logic for other timeframes
         possible_paths = [
@@ -192,7 +237,7 @@ def load_local_data(symbol, exchange, timeframe="1m"):
         
         file_path = None
         for path in possible_paths:
-            if os.path.exists(path):
+            if _data_file_exists(path):
                 file_path = path
                 break
         
@@ -203,38 +248,177 @@ def load_local_data(symbol, exchange, timeframe="1m"):
             return _load_csv_file(file_path)
 
 
+def _parquet_path(file_path):
+    """Return the Parquet counterpart of a CSV data file path."""
+    return os.path.splitext(file_path)[0] + ".parquet"
+
+
+def _stock_data_files():
+    """
+    Return the set of file names in STOCK_DATA_FOLDER.
+    
+    The folder is listed with a single os.scandir pass and the listing is
+    reused until the folder's modification time changes.
+    """
+    try:
+        mtime = os.stat(STOCK_DATA_FOLDER).st_mtime_ns
+    except OSError:
+        return frozenset()
+    if mtime != _stock_data_listing["mtime"]:
+        with os.scandir(STOCK_DATA_FOLDER) as entries:
+            names = frozenset(entry.name for entry in entries if entry.is_file())
+        _stock_data_listing.update(mtime=mtime, names=names)
+    return _stock_data_listing["names"]
+
+
+def _data_file_exists(file_path):
+    """Check whether a CSV data file or its Parquet counterpart exists."""
+    candidates = [file_path]
+    if PARQUET_AVAILABLE:
+        candidates.append(_parquet_path(file_path))
+    
+    if os.path.dirname(file_path) == STOCK_DATA_FOLDER:
+        names = _stock_data_files()
+        return any(os.path.basename(path) in names for path in candidates)
+    return any(os.path.exists(path) for path in candidates)
+
+
+def _data_file_mtime(file_path):
+    """Return the modification time of a data file (or its Parquet counterpart)."""
+    for path in (file_path, _parquet_path(file_path)):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            continue
+    return None
+
+
 def _load_csv_file(file_path):
-    """Load and process a CSV file."""
+    """
+    Load and process a CSV file, returning a private copy of the cached frame.
+    
+    Parsed frames are memoized per (path, mtime), so repeated loads of the same
+    file across timeframes and runs skip disk I/O until the file is rewritten.
+    """
+    df = _load_csv_file_cached(file_path, _data_file_mtime(file_path))
+    return df.copy() if df is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_csv_file_cached(file_path, mtime):
+    """
+    Load and process a CSV file; cached per (path, mtime) by _load_csv_file.
+    
+    If a Parquet copy of the file exists and is at least as new as the CSV it is
+    read instead, skipping text parsing and datetime conversion. After parsing a
+    CSV a Parquet copy is written so subsequent runs take the fast path.
+    """
+    parquet_path = _parquet_path(file_path)
+    if PARQUET_AVAILABLE and os.path.exists(parquet_path) and (
+            not os.path.exists(file_path)
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(file_path)):
+        try:
+            df = pd.read_parquet(parquet_path, engine='pyarrow')
+            if ('close' in df.columns and df['close'].dtype != PRICE_DTYPES['close']
+                    and os.path.exists(file_path)):
+                # Written when close was still stored as float32; rebuild it from the CSV
+                logger.info(f"Ignoring {parquet_path} with {df['close'].dtype} close prices")
+            else:
+                logger.info(f"Loaded {len(df)} records from {parquet_path}")
+                return df
+        except Exception as e:
+            logger.warning(f"Failed to read {parquet_path}, falling back to CSV: {e}")
+    
     try:
-        # Try to read with headers first
-        df = pd.read_csv(file_path)
+        # Try to read with headers first; pyarrow's multithreaded parser keeps
+        # the default numpy-backed dtypes for the resample/EMA code downstream
+        df = pd.read_csv(file_path, dtype=PRICE_DTYPES, engine=CSV_ENGINE)
         
         # If no headers or only 2 columns, assume it's date,close format
         if len(df.columns) == 2 and not any(col in df.columns for col in ['open', 'high', 'low', 'close']):
             df.columns = ['date', 'close']
+            # Make close numeric up front so every synthesized column inherits
+            # a numeric dtype instead of object/categorical columns reaching resample
+            df['close'] = df['close'].astype(PRICE_DTYPES['close'])
             # Create OHLC data from close price (simple approximation)
             df['open'] = df['close'].shift(1).fillna(df['close'])
-            df['high'] = df[['open', 'close']].max(axis=1)
-            df['low'] = df[['open', 'close']].min(axis=1)
-            df['volume'] = 1000  # Default volume
+            # Element-wise max/min on the raw arrays avoids a temporary 2-column frame
+            open_prices = df['open'].to_numpy(copy=False)
+            close_prices = df['close'].to_numpy(copy=False)
+            df['high'] = np.maximum(open_prices, close_prices)
+            df['low'] = np.minimum(open_prices, close_prices)
+            df['volume'] = np.full(len(df), 1000, dtype=np.int32)  # Default volume
         
         if 'date' in df.columns:
             df['date'] = pd.to_datetime(df['date'])
             df.set_index('date', inplace=True)
         
+        df = _optimize_dataframe_memory(df)
         logger.info(f"Loaded {len(df)} records from {file_path}")
-        return df
     except Exception as e:
         logger.error(f"Failed to load data from {file_path}: {e}")
         return None
+    
+    if PARQUET_AVAILABLE:
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression=PARQUET_COMPRESSION)
+        except Exception as e:
+            logger.warning(f"Could not write Parquet copy {parquet_path}: {e}")
+    return df
+
+
+def _optimize_dataframe_memory(df):
+    """Cast OHLC columns to PRICE_DTYPES and downcast volume to the smallest integer type."""
+    price_dtypes = {col: dtype for col, dtype in PRICE_DTYPES.items() if col in df.columns}
+    if price_dtypes:
+        df = df.astype(price_dtypes)
+    if 'volume' in df.columns:
+        df['volume'] = pd.to_numeric(df['volume'], downcast='integer')
+    return df
+
+
+def _load_base_data(symbol, exchange):
+    """
+    Load the 1-minute base data for a symbol.
+    
+    Returns the shared cached frame without copying, so every aggregation in a
+    run reuses a single load. Callers must not mutate the returned frame.
+    """
+    file_path = os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv")
+    return _load_csv_file_cached(file_path, _data_file_mtime(file_path))
+
+
+def _resample_from_base(base_df, rule):
+    """
+    Resample OHLCV bars to a larger timeframe given a pandas offset rule.
+    
+    Bars are grouped with pd.Grouper. If the data is sparse relative to the
+    rule (e.g. an outlier timestamp stretching the span far beyond the
+    trading sessions), rows are grouped by their floored bin label instead so
+    the empty bins in between are never materialized.
+    """
+    offset = pd.tseries.frequencies.to_offset(rule)
+    index = base_df.index
+    if len(index) and _is_sparse_for(index, offset):
+        return base_df.groupby(index.floor(offset)).agg(OHLCV_AGG).dropna()
+    return base_df.groupby(pd.Grouper(freq=offset)).agg(OHLCV_AGG).dropna()
 
 
-def _aggregate_to_10m(symbol, exchange):
+def _is_sparse_for(index, offset):
+    """Check whether resampling index at a fixed offset would mostly create empty bins."""
+    try:
+        bin_nanos = offset.nanos
+    except ValueError:
+        return False  # Calendar offsets (weeks, months) cannot be floored
+    span_nanos = (index.max() - index.min()).value
+    return span_nanos / bin_nanos > SPARSE_BIN_RATIO * len(index)
+
+
+def _aggregate_to_10m(symbol, exchange, base_df=None):
     """Aggregate 1-minute data to 10-minute bars."""
     logger.info(f"Attempting to aggregate 1m data to 10m for {symbol}")
     
-    # Try to load 1-minute data
-    df_1m = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
+    df_1m = base_df if base_df is not None else _load_base_data(symbol, exchange)
     if df_1m is None:
         logger.error(f"❌ INSUFFICIENT DATA: Cannot find 1m data file for {symbol} to aggregate to 10m")
         return None
@@ -244,24 +428,17 @@ def _aggregate_to_10m(symbol, exchange):
         return None
     
     # Resample to 10 minutes
-    df_10m = df_1m.resample('10min').agg({
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'sum'
-    }).dropna()
+    df_10m = _resample_from_base(df_1m, '10min')
     
     logger.info(f"✅ Successfully aggregated {len(df_1m)} 1m bars to {len(df_10m)} 10m bars")
     return df_10m
 
 
-def _aggregate_to_30m(symbol, exchange):
+def _aggregate_to_30m(symbol, exchange, base_df=None):
     """Aggregate 1-minute data to 30-minute bars."""
     logger.info(f"Attempting to aggregate 1m data to 30m for {symbol}")
     
-    # Try to load 1-minute data
-    df_1m = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
+    df_1m = base_df if base_df is not None else _load_base_data(symbol, exchange)
     if df_1m is None:
         logger.error(f"❌ INSUFFICIENT DATA: Cannot find 1m data file for {symbol} to aggregate to 30m")
         return None
@@ -271,32 +448,20 @@ def _aggregate_to_30m(symbol, exchange):
         return None
     
     # Resample to 30 minutes
-    df_30m = df_1m.resample('30min').agg({
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'sum'
-    }).dropna()
+    df_30m = _resample_from_base(df_1m, '30min')
     
     logger.info(f"✅ Successfully aggregated {len(df_1m)} 1m bars to {len(df_30m)} 30m bars")
     return df_30m
 
 
-def _aggregate_to_1h(symbol, exchange):
+def _aggregate_to_1h(symbol, exchange, base_df=None):
     """Aggregate smaller timeframe data to 1-hour bars."""
     logger.info(f"Attempting to aggregate data to 1h for {symbol}")
     
     # Try 1m data first
-    df_1m = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
+    df_1m = base_df if base_df is not None else _load_base_data(symbol, exchange)
     if df_1m is not None and len(df_1m) >= 60:
-        df_1h = df_1m.resample('1H').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }).dropna()
+        df_1h = _resample_from_base(df_1m, '1h')
         logger.info(f"✅ Successfully aggregated {len(df_1m)} 1m bars to {len(df_1h)} 1h bars")
         return df_1h
     
@@ -304,20 +469,14 @@ def _aggregate_to_1h(symbol, exchange):
     return None
 
 
-def _aggregate_to_3h(symbol, exchange):
+def _aggregate_to_3h(symbol, exchange, base_df=None):
     """Aggregate smaller timeframe data to 3-hour bars."""
     logger.info(f"Attempting to aggregate data to 3h for {symbol}")
     
     # Try 1m data first
-    df_1m = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
+    df_1m = base_df if base_df is not None else _load_base_data(symbol, exchange)
     if df_1m is not None and len(df_1m) >= 180:
-        df_3h = df_1m.resample('3H').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }).dropna()
+        df_3h = _resample_from_base(df_1m, '3h')
         logger.info(f"✅ Successfully aggregated {len(df_1m)} 1m bars to {len(df_3h)} 3h bars")
         return df_3h
     
@@ -325,20 +484,14 @@ def _aggregate_to_3h(symbol, exchange):
     return None
 
 
-def _aggregate_to_1d(symbol, exchange):
+def _aggregate_to_1d(symbol, exchange, base_df=None):
     """Aggregate smaller timeframe data to 1-day bars."""
     logger.info(f"Attempting to aggregate data to 1d for {symbol}")
     
     # Try 1m data first
-    df_1m = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
+    df_1m = base_df if base_df is not None else _load_base_data(symbol, exchange)
     if df_1m is not None and len(df_1m) >= 1440:  # 24 hours * 60 minutes
-        df_1d = df_1m.resample('1D').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }).dropna()
+        df_1d = _resample_from_base(df_1m, '1D')
         logger.info(f"✅ Successfully aggregated {len(df_1m)} 1m bars to {len(df_1d)} 1d bars")
         return df_1d
     
@@ -352,20 +505,92 @@ def _aggregate_to_1d(symbol, exchange):
     return None
 
 
-def run_multi_timeframe_analysis(symbol, exchange, use_live_data=False):
+def _save_trades(trades_df, symbol, timeframe_key):
     """
-    Run MACD strategy analysis across multiple timeframes.
+    Write the trades of one timeframe to the report folder.
+    
+    Returns:
+        str: Path of the written CSV, or None if there were no trades
+    """
+    if trades_df.empty:
+        return None
+    trades_path = os.path.join(REPORT_DUMP_FOLDER, f"trades_{symbol}_{timeframe_key}.csv")
+    trades_df.to_csv(trades_path, index=False)
+    logger.info(f"Trade details for {TIMEFRAMES[timeframe_key]['description']} saved to: {trades_path}")
+    return trades_path
+
+
+def _run_one_timeframe(timeframe_key, base_df, symbol, exchange):
+    """
+    Load data for one timeframe and run the strategy on it.
+    
+    Kept at module level so it can be pickled into worker processes. Trades
+    are written to disk here so only the summary travels back to the parent.
+    
+    Returns:
+        Tuple of (timeframe_key, result dict or None if no data was available)
+    """
+    config = TIMEFRAMES[timeframe_key]
+    try:
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Analyzing {config['description']} timeframe")
+        logger.info(f"{'='*50}")
+        
+        df_timeframe = load_local_data(symbol, exchange, timeframe_key, base_df)
+        
+        if df_timeframe is None or df_timeframe.empty:
+            logger.warning(f"No data available for {config['description']}")
+            return timeframe_key, None
+        
+        # Apply strategy; report files are written in the background and
+        # joined when the executor block exits
+        with ThreadPoolExecutor(max_workers=2) as io_executor:
+            trades_df, total_profit, strategy_stats = apply_strategies(
+                df_timeframe, symbol, exchange, config['description'], io_executor=io_executor
+            )
+        
+        result = {
+            'timeframe': config['description'],
+            'data_points': len(df_timeframe),
+            'total_trades': len(trades_df),
+            'trades_path': _save_trades(trades_df, symbol, timeframe_key),
+            'total_profit': total_profit,
+            'strategy_stats': strategy_stats,
+            'data_period': f"{df_timeframe.index.min()} to {df_timeframe.index.max()}"
+        }
+        
+        # Print summary
+        if trades_df.empty:
+            logger.info(f"No trades triggered for {config['description']}")
+        else:
+            logger.info(f"Completed {len(trades_df)} trades with total profit: ₹{total_profit:.2f}")
+            logger.info(f"Win rate: {strategy_stats.get('win_rate', 0):.1f}%")
+        
+        return timeframe_key, result
+        
+    except Exception as e:
+        logger.error(f"Error analyzing {config['description']}: {e}")
+        return timeframe_key, {
+            'timeframe': config['description'],
+            'error': str(e)
+        }
+
+
+def iter_timeframe_results(symbol, exchange, use_live_data=False):
+    """
+    Run MACD strategy analysis across multiple timeframes, yielding results lazily.
+    
+    Each timeframe's trades are written to the report folder as soon as it
+    finishes, so only its summary (not the trades DataFrame) is kept.
     
     Args:
         symbol: Trading symbol
         exchange: Exchange name
         use_live_data: Whether to fetch fresh data from API
         
-    Returns:
-        Dict: Results for each timeframe
+    Yields:
+        Tuple of (timeframe_key, result dict), in TIMEFRAMES order
     """
-    results = {}
-    
     # First, get the base 1-minute data
     if use_live_data:
         brokerage_client = BrokerageClient()
@@ -375,22 +600,22 @@ def run_multi_timeframe_analysis(symbol, exchange, use_live_data=False):
             
             if instrument_token == -1:
                 logger.error(f"Instrument token not found for {exchange}:{symbol}")
-                return results
+                return
             
             base_df = fetch_historical_data(brokerage_client, symbol, exchange, "minute")
         except Exception as e:
             logger.error(f"Error fetching data: {e}")
-            return results
+            return
     else:
-        # Load 1-minute data directly for base_df
-        base_df = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
+        # Load 1-minute data once; every timeframe aggregates from it
+        base_df = _load_base_data(symbol, exchange)
         if base_df is None:
             logger.error(f"Could not load 1m base data for {symbol}")
-            return results
+            return
     
     if base_df.empty:
         logger.error("No base data available")
-        return results
+        return
     
     # Ensure date column is properly set as index
     if 'date' in base_df.columns:
@@ -400,64 +625,32 @@ def run_multi_timeframe_analysis(symbol, exchange, use_live_data=False):
     logger.info(f"Starting multi-timeframe analysis for {symbol} ({exchange})")
     logger.info(f"Base data: {len(base_df)} records from {base_df.index.min()} to {base_df.index.max()}")
     
-    # Run analysis for each timeframe
-    for timeframe_key, config in TIMEFRAMES.items():
-        try:
-            logger.info(f"\n{'='*50}")
-            logger.info(f"Analyzing {config['description']} timeframe")
-            logger.info(f"{'='*50}")
-            
-            # Load data for this timeframe using new logic
-            if timeframe_key == "1m":
-                df_timeframe = load_local_data(symbol, exchange, "1m")
-            elif timeframe_key == "10m":
-                df_timeframe = load_local_data(symbol, exchange, "10m")
-            elif timeframe_key == "30m":
-                df_timeframe = load_local_data(symbol, exchange, "30m")
-            elif timeframe_key == "1h":
-                df_timeframe = load_local_data(symbol, exchange, "1h")
-            elif timeframe_key == "3h":
-                df_timeframe = load_local_data(symbol, exchange, "3h")
-            elif timeframe_key == "1d":
-                df_timeframe = load_local_data(symbol, exchange, "1d")
-            else:
-                # Fallback to old resampling logic
-                df_timeframe = resample_data(base_df, timeframe_key)
-            
-            if df_timeframe.empty:
-                logger.warning(f"No data available for {config['description']}")
-                continue
-            
-            # Apply strategy
-            trades_df, total_profit, strategy_stats = apply_strategies(
-                df_timeframe, symbol, exchange, config['description']
-            )
-            
-            # Store results
-            results[timeframe_key] = {
-                'timeframe': config['description'],
-                'data_points': len(df_timeframe),
-                'trades_df': trades_df,
-                'total_profit': total_profit,
-                'strategy_stats': strategy_stats,
-                'data_period': f"{df_timeframe.index.min()} to {df_timeframe.index.max()}"
-            }
-            
-            # Print summary
-            if trades_df.empty:
-                logger.info(f"No trades triggered for {config['description']}")
-            else:
-                logger.info(f"Completed {len(trades_df)} trades with total profit: ₹{total_profit:.2f}")
-                logger.info(f"Win rate: {strategy_stats.get('win_rate', 0):.1f}%")
-                
-        except Exception as e:
-            logger.error(f"Error analyzing {config['description']}: {e}")
-            results[timeframe_key] = {
-                'timeframe': config['description'],
-                'error': str(e)
-            }
+    # Timeframes are independent, so run them in separate worker processes
+    max_workers = min(len(TIMEFRAMES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run_one_timeframe, timeframe_key, base_df, symbol, exchange)
+            for timeframe_key in TIMEFRAMES
+        ]
+        for future in futures:
+            timeframe_key, result = future.result()
+            if result is not None:
+                yield timeframe_key, result
+
+
+def run_multi_timeframe_analysis(symbol, exchange, use_live_data=False):
+    """
+    Run MACD strategy analysis across multiple timeframes.
     
-    return results
+    Args:
+        symbol: Trading symbol
+        exchange: Exchange name
+        use_live_data: Whether to fetch fresh data from API
+        
+    Returns:
+        Dict: Results for each timeframe
+    """
+    return dict(iter_timeframe_results(symbol, exchange, use_live_data))
 
 
 def print_comprehensive_results(results):
@@ -471,42 +664,41 @@ def print_comprehensive_results(results):
     print("COMPREHENSIVE MULTI-TIMEFRAME ANALYSIS RESULTS")
     print(f"{'='*80}")
     
-    # Create summary table
-    summary_data = []
-    for timeframe_key, result in results.items():
-        if 'error' in result:
-            summary_data.append({
-                'Timeframe': result['timeframe'],
-                'Data Points': 'Error',
-                'Total Trades': 'Error',
-                'Total Profit (₹)': 'Error',
-                'Win Rate (%)': 'Error',
-                'Avg Profit/Trade (₹)': 'Error'
-            })
-        else:
-            stats = result['strategy_stats']
-            summary_data.append({
-                'Timeframe': result['timeframe'],
-                'Data Points': result['data_points'],
-                'Total Trades': stats.get('total_trades', 0),
-                'Total Profit (₹)': f"{result['total_profit']:.2f}",
-                'Win Rate (%)': f"{stats.get('win_rate', 0):.1f}",
-                'Avg Profit/Trade (₹)': f"{stats.get('avg_profit_per_trade', 0):.2f}"
-            })
+    # Create summary table column by column; errored timeframes get zero
+    # placeholders that are masked with 'Error' after formatting
+    result_list = list(results.values())
+    stats_list = [result.get('strategy_stats', {}) for result in result_list]
+    errored = [('error' in result) for result in result_list]
+    summary_df = pd.DataFrame({
+        'Timeframe': [result['timeframe'] for result in result_list],
+        'Data Points': [result.get('data_points', 0) for result in result_list],
+        'Total Trades': [stats.get('total_trades', 0) for stats in stats_list],
+        'Total Profit (₹)': [result.get('total_profit', 0.0) for result in result_list],
+        'Win Rate (%)': [stats.get('win_rate', 0) for stats in stats_list],
+        'Avg Profit/Trade (₹)': [stats.get('avg_profit_per_trade', 0) for stats in stats_list]
+    })
+    summary_df['Total Profit (₹)'] = summary_df['Total Profit (₹)'].map('{:.2f}'.format)
+    summary_df['Win Rate (%)'] = summary_df['Win Rate (%)'].map('{:.1f}'.format)
+    summary_df['Avg Profit/Trade (₹)'] = summary_df['Avg Profit/Trade (₹)'].map('{:.2f}'.format)
+    
+    value_columns = summary_df.columns[1:]
+    summary_df[value_columns] = summary_df[value_columns].astype(object)
+    summary_df.loc[errored, value_columns] = 'Error'
     
     # Print summary table
-    summary_df = pd.DataFrame(summary_data)
     print("\nSUMMARY TABLE:")
     print(summary_df.to_string(index=False))
     
     # Find best performing timeframe
     valid_results = {k: v for k, v in results.items() if 'error' not in v}
     if valid_results:
-        best_timeframe = max(valid_results.items(), key=lambda x: x[1]['total_profit'])
-        print(f"\n🏆 BEST PERFORMING TIMEFRAME: {best_timeframe[1]['timeframe']}")
-        print(f"   Total Profit: ₹{best_timeframe[1]['total_profit']:.2f}")
-        print(f"   Win Rate: {best_timeframe[1]['strategy_stats'].get('win_rate', 0):.1f}%")
-        print(f"   Total Trades: {best_timeframe[1]['strategy_stats'].get('total_trades', 0)}")
+        profits = np.fromiter((result['total_profit'] for result in valid_results.values()),
+                              dtype=np.float64, count=len(valid_results))
+        best_result = list(valid_results.values())[int(profits.argmax())]
+        print(f"\n🏆 BEST PERFORMING TIMEFRAME: {best_result['timeframe']}")
+        print(f"   Total Profit: ₹{best_result['total_profit']:.2f}")
+        print(f"   Win Rate: {best_result['strategy_stats'].get('win_rate', 0):.1f}%")
+        print(f"   Total Trades: {best_result['strategy_stats'].get('total_trades', 0)}")
     
     print(f"\n{'='*80}")
     print("Detailed results and plots saved in the 'backtesting/report_dump' folder")
@@ -517,9 +709,6 @@ def main():
     """
     Main function to run multi-timeframe backtesting analysis.
     """
-    ensure_data_folder()
-    ensure_report_dump_folder()
-
     # Configuration
     use_live_data = False  # Set to True to fetch fresh data from API
     exchange, symbol = INTRADAY_TARGET_STOCK.split(":")
@@ -551,37 +740,32 @@ def save_detailed_results(results, symbol, exchange):
         exchange: Exchange name
     """
     try:
-        # Save summary results
-        summary_data = []
-        for timeframe_key, result in results.items():
-            if 'error' not in result:
-                stats = result['strategy_stats']
-                summary_data.append({
-                    'timeframe': result['timeframe'],
-                    'data_points': result['data_points'],
-                    'total_trades': stats.get('total_trades', 0),
-                    'total_profit': result['total_profit'],
-                    'win_rate': stats.get('win_rate', 0),
-                    'avg_profit_per_trade': stats.get('avg_profit_per_trade', 0),
-                    'max_profit': stats.get('max_profit', 0),
-                    'max_loss': stats.get('max_loss', 0),
-                    'winning_trades': stats.get('winning_trades', 0),
-                    'losing_trades': stats.get('losing_trades', 0),
-                    'data_period': result['data_period']
-                })
+        # Save summary results, built column by column
+        valid_results = [result for result in results.values() if 'error' not in result]
         
-        if summary_data:
-            summary_df = pd.DataFrame(summary_data)
+        if valid_results:
+            stats_list = [result['strategy_stats'] for result in valid_results]
+            summary_df = pd.DataFrame({
+                'timeframe': [result['timeframe'] for result in valid_results],
+                'data_points': [result['data_points'] for result in valid_results],
+                'total_trades': [stats.get('total_trades', 0) for stats in stats_list],
+                'total_profit': [result['total_profit'] for result in valid_results],
+                'win_rate': [stats.get('win_rate', 0) for stats in stats_list],
+                'avg_profit_per_trade': [stats.get('avg_profit_per_trade', 0) for stats in stats_list],
+                'max_profit': [stats.get('max_profit', 0) for stats in stats_list],
+                'max_loss': [stats.get('max_loss', 0) for stats in stats_list],
+                'winning_trades': [stats.get('winning_trades', 0) for stats in stats_list],
+                'losing_trades': [stats.get('losing_trades', 0) for stats in stats_list],
+                'data_period': [result['data_period'] for result in valid_results]
+            })
             summary_path = os.path.join(REPORT_DUMP_FOLDER, f"multi_timeframe_summary_{symbol}.csv")
             summary_df.to_csv(summary_path, index=False)
             logger.info(f"Summary results saved to: {summary_path}")
         
-        # Save individual trade details for each timeframe
-        for timeframe_key, result in results.items():
-            if 'error' not in result and not result['trades_df'].empty:
-                trades_path = os.path.join(REPORT_DUMP_FOLDER, f"trades_{symbol}_{timeframe_key}.csv")
-                result['trades_df'].to_csv(trades_path, index=False)
-                logger.info(f"Trade details for {result['timeframe']} saved to: {trades_path}")
+        # Trade details are written per timeframe during the analysis
+        for result in valid_results:
+            if result.get('trades_path'):
+                logger.info(f"Trade details for {result['timeframe']} are in: {result['trades_path']}")
                 
     except Exception as e:
         logger.error(f"Failed to save detailed results: {e}")
@@ -606,10 +790,6 @@ def run_single_timeframe(timeframe_key, symbol=None, exchange=None, use_live_dat
     if symbol is None or exchange is None:
         exchange, symbol = INTRADAY_TARGET_STOCK.split(":")
     
-    # Ensure folders exist
-    ensure_data_folder()
-    ensure_report_dump_folder()
-    
     logger.info(f"Running single timeframe analysis: {TIMEFRAMES[timeframe_key]['description']}")
     
     # Get base data
@@ -627,54 +807,42 @@ def run_single_timeframe(timeframe_key, symbol=None, exchange=None, use_live_dat
         except Exception as e:
             logger.error(f"Error fetching data: {e}")
             return {}
+        
+        if base_df.empty:
+            logger.error("No base data available")
+            return {}
+        
+        # Ensure date column is properly set as index
+        if 'date' in base_df.columns:
+            base_df['date'] = pd.to_datetime(base_df['date'])
+            base_df.set_index('date', inplace=True)
     else:
-        # Load 1-minute data directly for base_df
-        base_df = _load_csv_file(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv"))
-        if base_df is None:
+        # Local 1m data is only loaded (from cache) if this timeframe needs aggregating
+        base_df = None
+        if not _data_file_exists(os.path.join(STOCK_DATA_FOLDER, f"{exchange}_{symbol}_1m.csv")):
             logger.error(f"Could not load 1m base data for {symbol}")
             return {}
     
-    if base_df.empty:
-        logger.error("No base data available")
-        return {}
-    
-    # Ensure date column is properly set as index
-    if 'date' in base_df.columns:
-        base_df['date'] = pd.to_datetime(base_df['date'])
-        base_df.set_index('date', inplace=True)
-    
     config = TIMEFRAMES[timeframe_key]
     
-    # Load data for this timeframe using new logic
-    if timeframe_key == "1m":
-        df_timeframe = load_local_data(symbol, exchange, "1m")
-    elif timeframe_key == "10m":
-        df_timeframe = load_local_data(symbol, exchange, "10m")
-    elif timeframe_key == "30m":
-        df_timeframe = load_local_data(symbol, exchange, "30m")
-    elif timeframe_key == "1h":
-        df_timeframe = load_local_data(symbol, exchange, "1h")
-    elif timeframe_key == "3h":
-        df_timeframe = load_local_data(symbol, exchange, "3h")
-    elif timeframe_key == "1d":
-        df_timeframe = load_local_data(symbol, exchange, "1d")
-    else:
-        # Fallback to old resampling logic
-        df_timeframe = resample_data(base_df, timeframe_key)
+    df_timeframe = load_local_data(symbol, exchange, timeframe_key, base_df)
     
-    if df_timeframe.empty:
+    if df_timeframe is None or df_timeframe.empty:
         logger.warning(f"No data available for {config['description']}")
         return {}
     
-    # Apply strategy
-    trades_df, total_profit, strategy_stats = apply_strategies(
-        df_timeframe, symbol, exchange, config['description']
-    )
+    # Apply strategy; report files are written in the background and
+    # joined when the executor block exits
+    with ThreadPoolExecutor(max_workers=2) as io_executor:
+        trades_df, total_profit, strategy_stats = apply_strategies(
+            df_timeframe, symbol, exchange, config['description'], io_executor=io_executor
+        )
     
     result = {
         'timeframe': config['description'],
         'data_points': len(df_timeframe),
-        'trades_df': trades_df,
+        'total_trades': len(trades_df),
+        'trades_path': _save_trades(trades_df, symbol, timeframe_key),
         'total_profit': total_profit,
         'strategy_stats': strategy_stats,
         'data_period': f"{df_timeframe.index.min()} to {df_timeframe.index.max()}"
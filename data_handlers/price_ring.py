@@ -0,0 +1,199 @@
+"""
+Shared-memory ring buffer of live prices.
+
+Lets indicators running in other processes pick up new prices straight from memory
+instead of re-reading and parsing the CSV files written by MarketDataLogger.
+"""
+import logging
+import os
+from datetime import datetime
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class PriceRing:
+    """
+    Fixed-size ring of (timestamp, price) records in named shared memory.
+
+    A single producer creates the ring for an exchange and symbol and appends to it;
+    any number of readers attach by the same exchange and symbol and consume records
+    past their own cursor. The header counts every record ever written, so a reader
+    that falls a full lap behind skips the overwritten records instead of misreading
+    them. Timestamps are stored as whole seconds of naive wall-clock time.
+    """
+
+    # Constants
+    DEFAULT_CAPACITY = 4096  # Records kept; about 68 hours of minute bars
+    NAME_PREFIX = "tbot_prices"
+    HEADER_SLOTS = 4  # capacity, records written, closed flag, producer PID
+
+    def __init__(self, exchange: str, symbol: str, create: bool = False,
+                 capacity: Optional[int] = None):
+        """
+        Create or attach to the ring for an exchange and symbol.
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading symbol
+            create: Create the ring as its producer; otherwise attach as a reader
+            capacity: Records the ring holds when creating it. If None, uses the default
+
+        Raises:
+            FileNotFoundError: If attaching and no producer has created the ring
+            FileExistsError: If creating and a live producer already owns the ring
+        """
+        self.name = self.shared_memory_name(exchange, symbol)
+        self._is_producer = create
+
+        if create:
+            capacity = capacity or self.DEFAULT_CAPACITY
+            size = 8 * (self.HEADER_SLOTS + 2 * capacity)
+            try:
+                self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+            except FileExistsError:
+                self._unlink_stale(self.name)
+                self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=self.name)
+            # Before Python 3.13 attaching also registers the segment with this process's
+            # resource tracker, which would unlink it from under the producer on exit
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        self._header = np.ndarray((self.HEADER_SLOTS,), dtype=np.int64, buffer=self._shm.buf)
+        if create:
+            self._header[:] = (capacity, 0, 0, os.getpid())
+        self.capacity = int(self._header[0])
+
+        offset = 8 * self.HEADER_SLOTS
+        self._times = np.ndarray((self.capacity,), dtype=np.int64, buffer=self._shm.buf, offset=offset)
+        self._prices = np.ndarray((self.capacity,), dtype=np.float64, buffer=self._shm.buf,
+                                  offset=offset + 8 * self.capacity)
+
+    # Public methods (alphabetically ordered)
+
+    def append(self, timestamp: datetime, price: float) -> None:
+        """
+        Append one price record, overwriting the oldest once the ring is full.
+
+        Args:
+            timestamp: Timestamp for the price; any timezone is dropped
+            price: Price to record
+        """
+        written = int(self._header[1])
+        slot = written % self.capacity
+        self._times[slot] = np.datetime64(timestamp.replace(tzinfo=None), "s").astype(np.int64)
+        self._prices[slot] = price
+        # Publish the record only after its slot is filled
+        self._header[1] = written + 1
+
+    def close(self) -> None:
+        """Detach from the ring; the producer also marks it closed and unlinks it."""
+        if self._shm is None:
+            return
+        if self._is_producer:
+            self._header[2] = 1
+        self._header = self._times = self._prices = None
+        self._shm.close()
+        if self._is_producer:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
+
+    @property
+    def closed(self) -> bool:
+        """True once this handle is closed or the producer has closed the ring."""
+        return self._shm is None or bool(self._header[2])
+
+    def read_since(self, cursor: int) -> Tuple[int, List[datetime], List[float]]:
+        """
+        Read the records appended after a reader's cursor.
+
+        Args:
+            cursor: Records already consumed; 0 reads everything still in the ring
+
+        Returns:
+            Tuple of (new cursor, timestamps, prices)
+        """
+        written = int(self._header[1])
+        if written - cursor > self.capacity:
+            logger.warning("Price ring %s overran %d records; skipping them",
+                           self.name, written - cursor - self.capacity)
+            cursor = written - self.capacity
+        if cursor >= written:
+            return written, [], []
+
+        slots = np.arange(cursor, written) % self.capacity
+        timestamps = self._times[slots].astype("datetime64[s]").tolist()
+        return written, timestamps, self._prices[slots].tolist()
+
+    @staticmethod
+    def shared_memory_name(exchange: str, symbol: str) -> str:
+        """
+        Get the shared memory name for an exchange and symbol.
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading symbol
+
+        Returns:
+            str: Name shared by the producer and its readers
+        """
+        return f"{PriceRing.NAME_PREFIX}_{exchange.upper()}_{symbol.upper()}"
+
+    # Private methods (alphabetically ordered)
+
+    @staticmethod
+    def _process_alive(pid: int) -> bool:
+        """
+        Check whether a process with the given PID is running.
+
+        Args:
+            pid: Process ID read from a ring header
+
+        Returns:
+            bool: True if the process exists, even if owned by another user
+        """
+        if pid <= 0:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        except (OverflowError, OSError):
+            return False
+        return True
+
+    @classmethod
+    def _unlink_stale(cls, name: str) -> None:
+        """
+        Unlink an existing ring only if its producer closed it or is no longer running.
+
+        Args:
+            name: Shared memory name of the ring
+
+        Raises:
+            FileExistsError: If the ring is still owned by a live producer
+        """
+        existing = shared_memory.SharedMemory(name=name)
+        header = np.ndarray((cls.HEADER_SLOTS,), dtype=np.int64, buffer=existing.buf)
+        closed, pid = bool(header[2]), int(header[3])
+        del header
+        if closed or not cls._process_alive(pid):
+            logger.info("Replacing stale price ring %s left by PID %d", name, pid)
+            existing.close()
+            existing.unlink()
+            return
+
+        # Leave the live ring alone; attaching registered it with this process's tracker
+        resource_tracker.unregister(existing._name, "shared_memory")
+        existing.close()
+        raise FileExistsError(f"Price ring {name} is already in use by producer PID {pid}")
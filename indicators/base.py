@@ -5,10 +5,17 @@ This module provides a base class for all technical indicators with common funct
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Any
+from typing import List, Optional, Tuple, Any
 from datetime import datetime
+import atexit
+import io
 import os
 
+import numpy as np
+import pandas as pd
+
+from data_handlers.price_ring import PriceRing
+
 
 class BaseIndicator(ABC):
     """
@@ -16,26 +23,39 @@ class BaseIndicator(ABC):
     
     Provides common functionality for file handling, data processing, and output management.
     """
+
+    INITIAL_CAPACITY = 1024  # Rows preallocated per series; doubled whenever full
+    OUTPUT_BUFFER_SIZE = 1 << 16  # Each update() writes its rows as one ASCII buffer
     
-    def __init__(self, exchange: str, ticker: str, **kwargs):
+    def __init__(self, exchange: str, ticker: str, verbose: bool = False,
+                 use_price_ring: bool = False, **kwargs):
         """
         Initialize base indicator.
         
         Args:
             exchange: Exchange name (e.g., 'NSE')
             ticker: Stock ticker (e.g., 'ITI')
+            verbose: Print every processed row instead of only the latest one per update
+            use_price_ring: After replaying the input file, read live prices from the
+                MarketDataLogger's shared-memory PriceRing instead of re-parsing the file
             **kwargs: Additional indicator-specific parameters
         """
         self.exchange = exchange.upper()
         self.ticker = ticker.upper()
+        self.verbose = verbose
+        self.use_price_ring = use_price_ring
         
         # Set up file paths
         self._setup_file_paths()
         
-        # Initialize data storage
-        self.prices = []
-        self.timestamps = []
-        self.last_processed_line = 0
+        # Initialize data storage; subclasses register their own series in _buffers
+        self._n = 0
+        self._prices = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._timestamps = np.empty(self.INITIAL_CAPACITY, dtype=object)
+        self._buffers = ['_prices', '_timestamps']
+        self._last_file_pos = 0
+        self._price_ring: Optional[PriceRing] = None
+        self._ring_cursor = 0
         
         # Create output directory
         os.makedirs("strategy_data", exist_ok=True)
@@ -43,8 +63,56 @@ class BaseIndicator(ABC):
         # Initialize indicator-specific data
         self._initialize_indicator_data(**kwargs)
         
-        # Initialize output file
+        # Initialize output file and keep it open for appends
         self._initialize_output_file()
+        self._out_fh = open(self.output_file, 'ab', buffering=self.OUTPUT_BUFFER_SIZE)
+        atexit.register(self.close)
+
+    def __enter__(self):
+        """Return the indicator for use in a with block."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the output file when leaving a with block."""
+        self.close()
+
+    def close(self):
+        """Flush and close the output file and detach from the price ring."""
+        # Drop the exit hook so closed indicators are not kept alive until shutdown
+        atexit.unregister(self.close)
+        if not self._out_fh.closed:
+            self._out_fh.close()
+        if self._price_ring is not None:
+            self._price_ring.close()
+            self._price_ring = None
+    
+    @property
+    def prices(self) -> np.ndarray:
+        """Prices processed so far."""
+        return self._prices[:self._n]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Timestamps of the prices processed so far."""
+        return self._timestamps[:self._n]
+
+    def _ensure_capacity(self, extra: int):
+        """Grow every registered series by doubling until `extra` more rows fit."""
+        size = self._prices.size
+        if self._n + extra <= size:
+            return
+        while size < self._n + extra:
+            size *= 2
+        for name in self._buffers:
+            old = getattr(self, name)
+            grown = np.empty(size, dtype=old.dtype)
+            grown[:self._n] = old[:self._n]
+            setattr(self, name, grown)
+    
+    def _format_output_row(self, timestamp: datetime, price: float, *values) -> str:
+        """Format one row of indicator values for the output file."""
+        values_str = ','.join([f"{v:.4f}" if isinstance(v, (int, float)) else str(v) for v in values])
+        return f"{timestamp.isoformat(' ', 'seconds')[:19]},{price:.2f},{values_str}\n"
     
     def _setup_file_paths(self):
         """Set up input and output file paths."""
@@ -72,54 +140,126 @@ class BaseIndicator(ABC):
         """Process a new price point and return indicator values."""
         pass
     
-    def _read_new_data(self) -> list:
-        """Read new data from the input file."""
-        new_data = []
+    def _process_rows(self, new_data: list) -> List[Tuple[Any, ...]]:
+        """
+        Process a batch of (timestamp, price) rows and return indicator values for each.
+        
+        Defaults to one _process_new_price call per row; subclasses can override this
+        to compute long batches in a single vectorized pass.
+        """
+        return [self._process_new_price(timestamp, price) for timestamp, price in new_data]
+    
+    def _attach_price_ring(self):
+        """Attach to the producer's price ring, staying on the input file if there is none yet."""
         try:
-            with open(self.input_file, 'r') as f:
-                lines = f.readlines()
-
-            for i in range(self.last_processed_line, len(lines)):
-                line = lines[i].strip()
-                if line and ',' in line:
-                    try:
-                        timestamp_str, price_str = line.split(',')
-                        timestamp = datetime.strptime(timestamp_str.strip(), '%Y-%m-%d %H:%M:%S')
-                        price = float(price_str.strip())
-                        new_data.append((timestamp, price))
-                    except ValueError:
-                        continue
-
-            self.last_processed_line = len(lines)
+            self._price_ring = PriceRing(self.exchange, self.ticker)
+            self._ring_cursor = 0
+        except FileNotFoundError:
+            pass
 
+    def _drop_processed(self, rows: list) -> list:
+        """Drop rows that are not newer than the last processed timestamp."""
+        if not self._n:
+            return rows
+        last = self._timestamps[self._n - 1]
+        return [(timestamp, price) for timestamp, price in rows if timestamp > last]
+
+    def _read_csv_data(self) -> list:
+        """
+        Read rows appended to the input file since the last call.
+        
+        Seeks to the byte offset where the previous read stopped instead of re-reading
+        the whole file, and parses the new rows in one vectorized pandas pass. Only
+        newline-terminated rows are consumed, so a row still being written is picked
+        up on the next poll. Headers and malformed rows are skipped. If the file was
+        rewritten shorter than the saved offset, reading resumes from its new end.
+        """
+        new_data = []
+        try:
+            with open(self.input_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < self._last_file_pos:
+                    print(f"Input file {self.input_file} was truncated, resuming from its end")
+                    self._last_file_pos = size
+                f.seek(self._last_file_pos)
+                chunk = f.read()
         except FileNotFoundError:
             print(f"Input file {self.input_file} not found")
+            return new_data
+
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return new_data
+        self._last_file_pos += end
+
+        # The spare column keeps a 3-field line from turning the first column into an
+        # index; such lines are dropped below and lines with more fields are skipped
+        rows = pd.read_csv(io.BytesIO(chunk[:end]), header=None, names=['time', 'price', 'extra'],
+                           index_col=False, dtype=str, on_bad_lines='skip', engine='c')
+        timestamps = pd.to_datetime(rows['time'].str.strip(), format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        prices = pd.to_numeric(rows['price'].str.strip(), errors='coerce')
+        valid = timestamps.notna() & prices.notna() & rows['extra'].isna()
 
+        # Build the datetimes from the parsed column: the format also accepts timestamps
+        # that are not zero-padded (as strptime did), which fromisoformat would reject
+        new_data = list(zip(timestamps[valid].dt.to_pydatetime().tolist(), prices[valid].tolist()))
         return new_data
     
-    def _write_to_output(self, timestamp: datetime, price: float, *values):
-        """Write indicator values to output file."""
-        with open(self.output_file, 'a') as f:
-            values_str = ','.join([f"{v:.4f}" if isinstance(v, (int, float)) else str(v) for v in values])
-            f.write(f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')},{price:.2f},{values_str}\n")
+    def _read_new_data(self) -> list:
+        """
+        Read new (timestamp, price) rows from the price ring or the input file.
+        
+        The input file is always replayed first. With use_price_ring, later polls read
+        the shared-memory ring instead, until its producer closes it; reading then goes
+        back to the input file from where it left off, skipping rows the ring delivered.
+        """
+        if self._price_ring is not None:
+            if not self._price_ring.closed:
+                self._ring_cursor, timestamps, prices = self._price_ring.read_since(self._ring_cursor)
+                return self._drop_processed(list(zip(timestamps, prices)))
+            print(f"Price ring {self._price_ring.name} was closed, reading {self.input_file} again")
+            self._price_ring.close()
+            self._price_ring = None
+            return self._drop_processed(self._read_csv_data())
+
+        new_data = self._read_csv_data()
+        if self.use_price_ring:
+            self._attach_price_ring()
+        return new_data
+    
+    def _write_to_output(self, rows: List[str]):
+        """Encode formatted output rows once and write them in a single call."""
+        if rows:
+            # One append per update is already a single syscall; pre-growing the file for
+            # an mmap would expose NUL padding to anything tailing the CSV mid-write
+            self._out_fh.write(''.join(rows).encode('ascii'))
+            self._out_fh.flush()
     
     def update(self):
         """Update indicator with new data."""
         new_data = self._read_new_data()
+        if not new_data:
+            return 0
+
+        results = self._process_rows(new_data)
+        self._write_to_output([self._format_output_row(timestamp, price, *values)
+                               for (timestamp, price), values in zip(new_data, results)])
 
-        for timestamp, price in new_data:
-            values = self._process_new_price(timestamp, price)
-            self._write_to_output(timestamp, price, *values)
-            
-            # Print update (can be overridden by subclasses)
-            self._print_update(timestamp, price, values)
+        # Print updates; only the latest unless verbose, and verbose output goes out
+        # as one print() per update rather than one per row
+        if self.verbose:
+            print('\n'.join([self._format_update(timestamp, price, values)
+                             for (timestamp, price), values in zip(new_data, results)]))
+        else:
+            timestamp, price = new_data[-1]
+            print(self._format_update(timestamp, price, results[-1]))
 
         return len(new_data)
     
-    def _print_update(self, timestamp: datetime, price: float, values: Tuple[Any, ...]):
-        """Print indicator update (can be overridden by subclasses)."""
+    def _format_update(self, timestamp: datetime, price: float, values: Tuple[Any, ...]) -> str:
+        """Format an indicator update line for printing (can be overridden by subclasses)."""
         values_str = ', '.join([f"{v:.4f}" if isinstance(v, (int, float)) else str(v) for v in values])
-        print(f"{timestamp}: Price={price:.2f}, {self._get_indicator_name().upper()}={values_str}")
+        return f"{timestamp}: Price={price:.2f}, {self._get_indicator_name().upper()}={values_str}"
     
     @abstractmethod
     def get_latest_values(self) -> Optional[Tuple[Any, ...]]:
@@ -5,12 +5,54 @@ This module implements the MACD technical indicator for real-time calculation.
 """
 
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 from .base import BaseIndicator
 
 
+def _macd_stream(prices, fast_ema, slow_ema, signal_ema, fast_alpha, slow_alpha, signal_alpha):
+    """
+    Continue all three MACD EMAs over a price array in one fused loop.
+
+    Uses the same arithmetic as MACDIndicator._calculate_ema, so results are
+    bit-identical to the per-tick path. Compiled with numba when it is installed.
+
+    Returns:
+        Tuple of (macd_line, signal_line, histogram, fast_ema, slow_ema, signal_ema)
+    """
+    n = prices.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    histogram = np.empty(n)
+    for i in range(n):
+        fast_ema = fast_alpha * prices[i] + (1 - fast_alpha) * fast_ema
+        slow_ema = slow_alpha * prices[i] + (1 - slow_alpha) * slow_ema
+        macd[i] = fast_ema - slow_ema
+        signal_ema = signal_alpha * macd[i] + (1 - signal_alpha) * signal_ema
+        signal[i] = signal_ema
+        histogram[i] = macd[i] - signal_ema
+    return macd, signal, histogram, fast_ema, slow_ema, signal_ema
+
+
+if NUMBA_AVAILABLE:
+    _macd_stream = njit(cache=True)(_macd_stream)
+
+
 class MACDIndicator(BaseIndicator):
     """
     MACD Indicator for real-time calculation.
@@ -19,13 +61,17 @@ class MACDIndicator(BaseIndicator):
     momentum indicator that shows the relationship between two moving averages 
     of a security's price.
     """
+
+    BATCH_MIN_ROWS = 32  # Shorter batches are cheaper through the per-tick path
     
     def __init__(self, 
                  exchange: str,
                  ticker: str,
                  fast_period: int = 12,
                  slow_period: int = 26,
-                 signal_period: int = 9):
+                 signal_period: int = 9,
+                 verbose: bool = False,
+                 use_price_ring: bool = False):
         """
         Initialize MACD Indicator for real-time calculation.
 
@@ -35,6 +81,8 @@ class MACDIndicator(BaseIndicator):
             fast_period: Fast EMA period
             slow_period: Slow EMA period
             signal_period: Signal line EMA period
+            verbose: Print every processed row instead of only the latest one per update
+            use_price_ring: Read live prices from the shared-memory PriceRing after replaying the input file
         """
         self.fast_period = fast_period
         self.slow_period = slow_period
@@ -45,20 +93,37 @@ class MACDIndicator(BaseIndicator):
         self.slow_alpha = 2 / (slow_period + 1)
         self.signal_alpha = 2 / (signal_period + 1)
         
-        super().__init__(exchange, ticker, 
+        super().__init__(exchange, ticker, verbose, use_price_ring,
                         fast_period=fast_period, 
                         slow_period=slow_period, 
                         signal_period=signal_period)
     
+    @property
+    def macd_line(self) -> np.ndarray:
+        """MACD line values computed so far."""
+        return self._macd[:self._n]
+
+    @property
+    def signal_line(self) -> np.ndarray:
+        """Signal line values computed so far."""
+        return self._signal[:self._n]
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """Histogram values computed so far."""
+        return self._histogram[:self._n]
+
     def _get_indicator_name(self) -> str:
         """Return the name of the indicator for file naming."""
         return "macd"
     
     def _initialize_indicator_data(self, **kwargs):
         """Initialize MACD-specific data structures."""
-        self.macd_line = []
-        self.signal_line = []
-        self.histogram = []
+        self._macd = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._signal = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._histogram = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._buffers += ['_macd', '_signal', '_histogram']
+        self._macd_sum = 0.0  # Running sum of the first signal_period MACD values
         
         self.fast_ema = None
         self.slow_ema = None
@@ -73,25 +138,38 @@ class MACDIndicator(BaseIndicator):
         """Calculate Exponential Moving Average."""
         return price if prev_ema is None else alpha * price + (1 - alpha) * prev_ema
 
-    def _calculate_sma(self, values: list, period: int) -> float:
+    def _ema_series(self, values: np.ndarray, prev_ema: float, alpha: float) -> np.ndarray:
+        """Calculate the EMA of a series continuing from a previous EMA value."""
+        return lfilter([alpha], [1, -(1 - alpha)], values, zi=[(1 - alpha) * prev_ema])[0]
+
+    def _is_warmed_up(self) -> bool:
+        """Return True once the next price takes the plain EMA branch for every line."""
+        return (self._n >= max(self.slow_period, self.signal_period)
+                and self.signal_ema is not None)
+
+    def _calculate_sma(self, values: np.ndarray, period: int) -> float:
         """Calculate Simple Moving Average."""
-        return sum(values[-period:]) / period
+        return float(values[-period:].mean())
     
     def _process_new_price(self, timestamp: datetime, price: float) -> Tuple[float, float, float]:
         """Process a new price point and return MACD values."""
-        self.timestamps.append(timestamp)
-        self.prices.append(price)
+        n = self._n
+        if n == self._prices.size:
+            self._ensure_capacity(1)
+        count = n + 1
+        self._timestamps[n] = timestamp
+        self._prices[n] = price
 
-        if len(self.prices) == 1:
+        if count == 1:
             # First price point
             self.fast_ema = price
             self.slow_ema = price
             macd_value = 0
             signal_value = 0
-        elif len(self.prices) <= self.slow_period:
+        elif count <= self.slow_period:
             # Building up to slow period
-            self.fast_ema = self._calculate_sma(self.prices, self.fast_period) if len(self.prices) >= self.fast_period else self._calculate_ema(price, self.fast_ema, self.fast_alpha)
-            self.slow_ema = self._calculate_sma(self.prices, self.slow_period) if len(self.prices) == self.slow_period else self._calculate_ema(price, self.slow_ema, self.slow_alpha)
+            self.fast_ema = self._calculate_sma(self._prices[:count], self.fast_period) if count >= self.fast_period else self._calculate_ema(price, self.fast_ema, self.fast_alpha)
+            self.slow_ema = self._calculate_sma(self._prices[:count], self.slow_period) if count == self.slow_period else self._calculate_ema(price, self.slow_ema, self.slow_alpha)
             macd_value = self.fast_ema - self.slow_ema
             signal_value = self.signal_ema if self.signal_ema is not None else macd_value
         else:
@@ -101,13 +179,12 @@ class MACDIndicator(BaseIndicator):
             macd_value = self.fast_ema - self.slow_ema
 
             # Calculate signal line
-            if len(self.macd_line) >= self.signal_period:
+            if n >= self.signal_period:
                 self.signal_ema = self._calculate_ema(macd_value, self.signal_ema, self.signal_alpha)
                 signal_value = self.signal_ema
             else:
-                temp_macd = self.macd_line + [macd_value]
-                if len(temp_macd) >= self.signal_period:
-                    signal_value = sum(temp_macd[-self.signal_period:]) / self.signal_period
+                if count >= self.signal_period:
+                    signal_value = (self._macd_sum + macd_value) / self.signal_period
                     self.signal_ema = signal_value
                 else:
                     signal_value = self.signal_ema if self.signal_ema is not None else macd_value
@@ -115,22 +192,84 @@ class MACDIndicator(BaseIndicator):
         histogram_value = macd_value - signal_value
 
         # Store values
-        self.macd_line.append(macd_value)
-        self.signal_line.append(signal_value)
-        self.histogram.append(histogram_value)
+        if n < self.signal_period:
+            self._macd_sum += macd_value
+        self._macd[n] = macd_value
+        self._signal[n] = signal_value
+        self._histogram[n] = histogram_value
+        self._n = count
 
         return macd_value, signal_value, histogram_value
+
+    def _process_batch(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Continue the fast, slow and signal EMAs over a batch of prices in one pass.
+
+        Requires every EMA to be seeded already; the first output of each filter
+        continues from the stored scalar EMA so results match the per-tick path.
+        Uses the fused numba kernel when available, otherwise scipy's lfilter.
+
+        Args:
+            prices: Prices following the last processed one
+
+        Returns:
+            Tuple of (macd_line, signal_line, histogram) arrays
+        """
+        if NUMBA_AVAILABLE:
+            macd, signal, histogram, self.fast_ema, self.slow_ema, self.signal_ema = _macd_stream(
+                prices, self.fast_ema, self.slow_ema, self.signal_ema,
+                self.fast_alpha, self.slow_alpha, self.signal_alpha)
+            return macd, signal, histogram
+
+        fast = self._ema_series(prices, self.fast_ema, self.fast_alpha)
+        slow = self._ema_series(prices, self.slow_ema, self.slow_alpha)
+        macd = fast - slow
+        signal = self._ema_series(macd, self.signal_ema, self.signal_alpha)
+
+        self.fast_ema = float(fast[-1])
+        self.slow_ema = float(slow[-1])
+        self.signal_ema = float(signal[-1])
+        return macd, signal, macd - signal
+
+    def _process_rows(self, new_data: list) -> List[Tuple[float, float, float]]:
+        """Process rows per tick through warmup, then vectorize long steady-state batches."""
+        results = []
+        start = 0
+        while start < len(new_data) and not self._is_warmed_up():
+            results.append(self._process_new_price(*new_data[start]))
+            start += 1
+
+        remaining = new_data[start:]
+        if not (NUMBA_AVAILABLE or SCIPY_AVAILABLE) or len(remaining) <= self.BATCH_MIN_ROWS:
+            results.extend(self._process_new_price(timestamp, price) for timestamp, price in remaining)
+            return results
+
+        prices = np.array([price for _, price in remaining], dtype=np.float64)
+        macd, signal, histogram = self._process_batch(prices)
+
+        self._ensure_capacity(len(remaining))
+        rows = slice(self._n, self._n + len(remaining))
+        self._timestamps[rows] = [timestamp for timestamp, _ in remaining]
+        self._prices[rows] = prices
+        self._macd[rows] = macd
+        self._signal[rows] = signal
+        self._histogram[rows] = histogram
+        self._n = rows.stop
+
+        results.extend(zip(macd.tolist(), signal.tolist(), histogram.tolist()))
+        return results
     
-    def _print_update(self, timestamp: datetime, price: float, values: Tuple[float, float, float]):
-        """Print MACD-specific update."""
+    def _format_update(self, timestamp: datetime, price: float, values: Tuple[float, float, float]) -> str:
+        """Format a MACD-specific update line."""
         macd_value, signal_value, histogram_value = values
-        print(f"{timestamp}: Price={price:.2f}, MACD={macd_value:.4f}, Signal={signal_value:.4f}, Histogram={histogram_value:.4f}")
+        return f"{timestamp}: Price={price:.2f}, MACD={macd_value:.4f}, Signal={signal_value:.4f}, Histogram={histogram_value:.4f}"
     
     def get_latest_values(self) -> Optional[Tuple[float, float, float]]:
         """Get the latest MACD values."""
-        if not self.macd_line:
+        if self._n == 0:
             return None
-        return (self.macd_line[-1], self.signal_line[-1], self.histogram[-1])
+        last = self._n - 1
+        return (float(self._macd[last]), float(self._signal[last]), float(self._histogram[last]))
     
     def start_streaming(self, interval: float = 1.0):
         """Start streaming MACD calculations."""
@@ -150,6 +289,8 @@ class MACDIndicator(BaseIndicator):
                     print(".", end="", flush=True)
         except KeyboardInterrupt:
             print("\nStopping MACD streamer...")
+        finally:
+            self.close()
 
     def process_existing_data(self):
         """Process all existing data in the input file."""
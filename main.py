@@ -3,7 +3,7 @@ Main entry point for the TradingBot application.
 Handles session setup, instrument fetching, price logging, and ticker streaming.
 """
 import logging
-import time
+import threading
 from typing import Optional, Any
 from core.brokerage_client import BrokerageClient
 from config.config import EXCHANGES, INTRADAY_TARGET_STOCK
@@ -79,29 +79,40 @@ def main() -> None:
     logging.info("Starting TradingBot main runner...")
 
     brokerage_client = BrokerageClient()
-    fetch_and_cache_instruments(brokerage_client)
+    price_logger = None
+    try:
+        fetch_and_cache_instruments(brokerage_client)
 
-    token_info = get_instrument_token_from_config(brokerage_client)
-    if not token_info:
-        logging.error("No valid instrument token found. Exiting.")
-        return
-    exchange, symbol, instrument_token = token_info
+        token_info = get_instrument_token_from_config(brokerage_client)
+        if not token_info:
+            logging.error("No valid instrument token found. Exiting.")
+            return
+        exchange, symbol, instrument_token = token_info
 
-    log_price_data(brokerage_client, symbol, exchange)
+        log_price_data(brokerage_client, symbol, exchange)
 
-    price_logger = MarketDataLogger(brokerage_client)
-    ticker_session = brokerage_client.start_live_data_stream(
-        instrument_token, exchange, symbol, price_logger
-    )
-    if not ticker_session:
-        logging.error("Ticker session could not be created. Exiting.")
-        return
+        price_logger = MarketDataLogger(brokerage_client)
+        ticker_session = start_ticker_stream(
+            brokerage_client, instrument_token, exchange, symbol, price_logger
+        )
+        if not ticker_session:
+            logging.error("Ticker session could not be created. Exiting.")
+            return
 
-    try:
-        while True:
-            time.sleep(0.5)
-    except KeyboardInterrupt:
-        logging.info("Interrupted by user. Shutting down.")
+        # The stream runs on its own threads. Block on an event in 1 s waits: a bare
+        # wait() cannot be interrupted by Ctrl+C on Windows
+        stop_event = threading.Event()
+        try:
+            while not stop_event.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            logging.info("Interrupted by user. Shutting down.")
+    finally:
+        # The tick writer is a daemon thread that buffers the ticker CSV and closed
+        # minute prices; drain it, then flush the price files, before exiting
+        brokerage_client.cleanup()
+        if price_logger is not None:
+            price_logger.close()
 
 
 if __name__ == "__main__":
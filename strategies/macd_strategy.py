@@ -1,13 +1,96 @@
+import bisect
+import numpy as np
 import pandas as pd  # type: ignore
 import matplotlib.pyplot as plt  # type: ignore
 import logging
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _ewm_alpha(span: int) -> float:
+    """Smoothing factor for an EMA span, computed exactly as pandas' ewm(span=...) does."""
+    return 1.0 / (1.0 + (span - 1) / 2.0)
+
+
+def _macd_kernel(close, fast_alpha, slow_alpha, signal_alpha):
+    """
+    Compute both EMAs, the MACD line and its signal line in one fused loop.
+
+    Mirrors the arithmetic of pandas' ewm(adjust=False).mean() step for step, so the
+    results are bit-identical to the pandas path. Compiled with numba when it is installed.
+
+    Returns:
+        Tuple of (fast_ema, slow_ema, macd, signal, histogram) arrays
+    """
+    n = close.shape[0]
+    fast_ema = np.empty(n)
+    slow_ema = np.empty(n)
+    macd = np.empty(n)
+    signal = np.empty(n)
+    histogram = np.empty(n)
+    
+    fast_old, slow_old, signal_old = 1.0 - fast_alpha, 1.0 - slow_alpha, 1.0 - signal_alpha
+    fast_norm, slow_norm, signal_norm = fast_old + fast_alpha, slow_old + slow_alpha, signal_old + signal_alpha
+    
+    fast = slow = close[0]
+    sig = fast - slow
+    for i in range(n):
+        price = close[i]
+        if i > 0:
+            if fast != price:
+                fast = (fast_old * fast + fast_alpha * price) / fast_norm
+            if slow != price:
+                slow = (slow_old * slow + slow_alpha * price) / slow_norm
+        fast_ema[i] = fast
+        slow_ema[i] = slow
+        macd[i] = fast - slow
+        if i > 0 and sig != macd[i]:
+            sig = (signal_old * sig + signal_alpha * macd[i]) / signal_norm
+        signal[i] = sig
+        histogram[i] = macd[i] - sig
+    return fast_ema, slow_ema, macd, signal, histogram
+
+
+if NUMBA_AVAILABLE:
+    _macd_kernel = njit(cache=True)(_macd_kernel)
+
+
+def _macd_lfilter(close, fast_alpha, slow_alpha, signal_alpha):
+    """
+    Compute the same columns as _macd_kernel with scipy's C first-order IIR filter.
+
+    ewm(adjust=False) is y[i] = alpha * x[i] + (1 - alpha) * y[i-1] seeded with x[0],
+    so each EMA is one lfilter call. Agrees with pandas to within float rounding
+    (~1e-13) rather than bit for bit, which is why numba is preferred when installed.
+
+    Returns:
+        Tuple of (fast_ema, slow_ema, macd, signal, histogram) arrays
+    """
+    def ema(values, alpha):
+        return lfilter([alpha], [1.0, alpha - 1.0], values, zi=[values[0] * (1.0 - alpha)])[0]
+    
+    fast_ema = ema(close, fast_alpha)
+    slow_ema = ema(close, slow_alpha)
+    macd = fast_ema - slow_ema
+    signal = ema(macd, signal_alpha)
+    return fast_ema, slow_ema, macd, signal, macd - signal
+
+
 class MACDStrategy:
     """
     MACD (Moving Average Convergence Divergence) trading strategy implementation.
@@ -41,13 +124,23 @@ class MACDStrategy:
         """
         self._validate_inputs(df, quantity, fast_period, slow_period, signal_period)
         
-        self.df = df.copy()
+        # Shallow copy: indicator columns are added to this frame only, and the input's
+        # column data, which the strategy never writes to, is shared instead of duplicated
+        self.df = df.copy(deep=False)
         self.quantity = quantity
         self.fast_period = fast_period
         self.slow_period = slow_period
         self.signal_period = signal_period
         self._signals_generated = False
         
+        # Signal flags kept as arrays too, so polling the latest one skips pandas
+        self._buy_signal: Optional[np.ndarray] = None
+        self._sell_signal: Optional[np.ndarray] = None
+        
+        # (quantity, trades, total profit) from the last calculate_profit, reused until
+        # the signals are regenerated or the quantity changes
+        self._profit_cache: Optional[Tuple[int, pd.DataFrame, float]] = None
+        
         logger.info("Initialized MACD strategy with %d data points, quantity=%d, periods=(%d,%d,%d)",
                    len(self.df), quantity, fast_period, slow_period, signal_period)
     
@@ -57,6 +150,9 @@ class MACDStrategy:
         """
         Calculate profit from MACD trading signals.
         
+        The result is cached, so repeated calls (e.g. from get_strategy_stats) return
+        the same trades DataFrame without walking the signals again.
+        
         Returns:
             Tuple containing:
             - DataFrame with trade details (buy_price, sell_price, profit)
@@ -69,38 +165,52 @@ class MACDStrategy:
             if not self._signals_generated:
                 self.generate_signals()
             
-            trades = []
-            position: Optional[Dict[str, float]] = None
+            if self._profit_cache is not None and self._profit_cache[0] == self.quantity:
+                return self._profit_cache[1], self._profit_cache[2]
             
             logger.debug("Calculating profits from MACD signals")
             
-            for index, row in self.df.iterrows():
-                if row["Buy_Signal"] and position is None:
-                    # Enter long position
-                    position = {"buy_price": row["close"], "buy_date": index}
-                    logger.debug("Buy signal at %s: %.2f", index, row["close"])
-                    
-                elif row["Sell_Signal"] and position is not None:
-                    # Exit long position
-                    sell_price = row["close"]
-                    profit = (sell_price - position["buy_price"]) * self.quantity
-                    
-                    trades.append({
-                        "buy_date": position["buy_date"],
-                        "sell_date": index,
-                        "buy_price": position["buy_price"],
-                        "sell_price": sell_price,
-                        "profit": profit,
-                        "return_pct": ((sell_price - position["buy_price"]) / position["buy_price"]) * 100
-                    })
-                    
-                    logger.debug("Sell signal at %s: %.2f, Profit: %.2f", index, sell_price, profit)
-                    position = None
-            
-            trades_df = pd.DataFrame(trades)
+            # Walk only the signal rows: each trade is the first buy while flat and the
+            # first sell strictly after it, and a buy on the exit row is ignored, exactly
+            # as a row-by-row scan would behave
+            buy_rows = np.flatnonzero(self.df["Buy_Signal"].to_numpy()).tolist()
+            sell_rows = np.flatnonzero(self.df["Sell_Signal"].to_numpy()).tolist()
+            entries: List[int] = []
+            exits: List[int] = []
+            next_buy = 0
+            while next_buy < len(buy_rows):
+                entry = buy_rows[next_buy]
+                next_sell = bisect.bisect_right(sell_rows, entry)
+                if next_sell == len(sell_rows):
+                    break
+                entries.append(entry)
+                exits.append(sell_rows[next_sell])
+                next_buy = bisect.bisect_right(buy_rows, sell_rows[next_sell], next_buy)
+            
+            if entries:
+                # P&L in float64 whatever dtype the caller stored prices in
+                closes = self.df["close"].to_numpy(np.float64)
+                buy_prices = closes[entries]
+                sell_prices = closes[exits]
+                trades_df = pd.DataFrame({
+                    "buy_date": self.df.index[entries],
+                    "sell_date": self.df.index[exits],
+                    "buy_price": buy_prices,
+                    "sell_price": sell_prices,
+                    "profit": (sell_prices - buy_prices) * self.quantity,
+                    "return_pct": ((sell_prices - buy_prices) / buy_prices) * 100
+                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    for trade in trades_df.itertuples(index=False):
+                        logger.debug("Buy at %s: %.2f, sell at %s: %.2f, Profit: %.2f", trade.buy_date,
+                                     trade.buy_price, trade.sell_date, trade.sell_price, trade.profit)
+            else:
+                trades_df = pd.DataFrame()
+            
             total_profit = trades_df["profit"].sum() if not trades_df.empty else 0.0
             
             logger.info("Calculated %d trades with total profit: %.2f", len(trades_df), total_profit)
+            self._profit_cache = (self.quantity, trades_df, total_profit)
             return trades_df, total_profit
             
         except Exception as e:
@@ -123,24 +233,43 @@ class MACDStrategy:
             logger.debug("Generating MACD signals with periods (%d,%d,%d)", 
                         self.fast_period, self.slow_period, self.signal_period)
             
-            # Calculate EMAs
-            self.df["EMA_12"] = self.df["close"].ewm(span=self.fast_period, adjust=False).mean()
-            self.df["EMA_26"] = self.df["close"].ewm(span=self.slow_period, adjust=False).mean()
-            
-            # Calculate MACD line and signal line
-            self.df["MACD"] = self.df["EMA_12"] - self.df["EMA_26"]
-            self.df["Signal"] = self.df["MACD"].ewm(span=self.signal_period, adjust=False).mean()
-            self.df["MACD_Histogram"] = self.df["MACD"] - self.df["Signal"]
-            
-            # Generate trading signals
-            self.df["Buy_Signal"] = (
-                (self.df["MACD"] > self.df["Signal"]) & 
-                (self.df["MACD"].shift(1) <= self.df["Signal"].shift(1))
-            )
-            self.df["Sell_Signal"] = (
-                (self.df["MACD"] < self.df["Signal"]) & 
-                (self.df["MACD"].shift(1) >= self.df["Signal"].shift(1))
-            )
+            if NUMBA_AVAILABLE or SCIPY_AVAILABLE:
+                # One compiled pass (or three C filter passes) instead of three ewm()
+                # traversals and two Series subtractions
+                macd_columns = _macd_kernel if NUMBA_AVAILABLE else _macd_lfilter
+                fast_ema, slow_ema, macd, signal, histogram = macd_columns(
+                    self.df["close"].to_numpy(np.float64), _ewm_alpha(self.fast_period),
+                    _ewm_alpha(self.slow_period), _ewm_alpha(self.signal_period))
+                self.df["EMA_12"] = fast_ema
+                self.df["EMA_26"] = slow_ema
+                self.df["MACD"] = macd
+                self.df["Signal"] = signal
+                self.df["MACD_Histogram"] = histogram
+            else:
+                # Calculate EMAs
+                self.df["EMA_12"] = self.df["close"].ewm(span=self.fast_period, adjust=False).mean()
+                self.df["EMA_26"] = self.df["close"].ewm(span=self.slow_period, adjust=False).mean()
+                
+                # Calculate MACD line and signal line
+                self.df["MACD"] = self.df["EMA_12"] - self.df["EMA_26"]
+                self.df["Signal"] = self.df["MACD"].ewm(span=self.signal_period, adjust=False).mean()
+                self.df["MACD_Histogram"] = self.df["MACD"] - self.df["Signal"]
+            
+            # Generate trading signals: a crossover is a change of side between consecutive
+            # rows, compared on the raw arrays instead of shifted, index-aligned Series
+            macd_values = self.df["MACD"].to_numpy()
+            signal_values = self.df["Signal"].to_numpy()
+            above = macd_values > signal_values
+            below = macd_values < signal_values
+            buy_signal = np.zeros(len(above), dtype=bool)
+            sell_signal = np.zeros(len(below), dtype=bool)
+            buy_signal[1:] = above[1:] & ~above[:-1]
+            sell_signal[1:] = below[1:] & ~below[:-1]
+            self.df["Buy_Signal"] = buy_signal
+            self.df["Sell_Signal"] = sell_signal
+            self._buy_signal = buy_signal
+            self._sell_signal = sell_signal
+            self._profit_cache = None
             
             # Count signals
             buy_signals = self.df["Buy_Signal"].sum()
@@ -165,14 +294,13 @@ class MACDStrategy:
         if not self._signals_generated:
             self.generate_signals()
         
-        if self.df.empty:
+        if not len(self._buy_signal):
             return None
-            
-        latest_row = self.df.iloc[-1]
         
-        if latest_row["Buy_Signal"]:
+        # Index the flag arrays directly; df.iloc[-1] builds a whole row Series
+        if self._buy_signal[-1]:
             return "BUY"
-        elif latest_row["Sell_Signal"]:
+        elif self._sell_signal[-1]:
             return "SELL"
         else:
             return None
@@ -262,7 +390,7 @@ class MACDStrategy:
             ax2.plot(self.df.index, self.df["Signal"], label="Signal Line", color='orange', linewidth=1)
             
             # MACD histogram
-            colors = ['green' if x > 0 else 'red' for x in self.df["MACD_Histogram"]]
+            colors = np.where(self.df["MACD_Histogram"].to_numpy() > 0, 'green', 'red')
             ax2.bar(self.df.index, self.df["MACD_Histogram"], label="MACD Histogram",
                    color=colors, alpha=0.6, width=0.8)
             
@@ -0,0 +1,60 @@
+"""
+Regression checks for how indicators parse rows appended to their input file.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+import gc
+import os
+import tempfile
+import unittest
+import weakref
+from datetime import datetime
+
+from indicators import MACDIndicator
+
+
+class IndicatorInputTest(unittest.TestCase):
+    """Feed raw CSV text through MACDIndicator._read_new_data in a scratch directory."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs("stock_data")
+        self.input_file = os.path.join("stock_data", "NSE_TEST_1minute.csv")
+        open(self.input_file, "w").close()
+        self.indicator = MACDIndicator("NSE", "TEST")
+
+    def tearDown(self):
+        self.indicator.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _read(self, text):
+        with open(self.input_file, "a") as f:
+            f.write(text)
+        return self.indicator._read_new_data()
+
+    def test_three_field_first_line_only_drops_that_line(self):
+        rows = self._read("2024-01-05 09:15:00,100.5,extra\n"
+                          "2024-01-05 09:16:00,101\n"
+                          "2024-01-05 09:17:00,102\n")
+        self.assertEqual(rows, [(datetime(2024, 1, 5, 9, 16), 101.0),
+                                (datetime(2024, 1, 5, 9, 17), 102.0)])
+
+    def test_unpadded_timestamp_is_accepted(self):
+        rows = self._read("2024-1-5 9:15:00,100\n")
+        self.assertEqual(rows, [(datetime(2024, 1, 5, 9, 15), 100.0)])
+        self.assertIs(type(rows[0][0]), datetime)
+
+    def test_closed_indicator_is_not_kept_alive(self):
+        indicator = MACDIndicator("NSE", "TEST")
+        ref = weakref.ref(indicator)
+        indicator.close()
+        del indicator
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+"""
+Regression checks for MarketDataLogger lifetime handling.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+import gc
+import tempfile
+import unittest
+import weakref
+
+from data_handlers.price_logger import MarketDataLogger
+
+
+class MarketDataLoggerCloseTest(unittest.TestCase):
+    """Closing a logger must release it rather than leave it pinned by its exit hook."""
+
+    def test_closed_logger_is_not_kept_alive(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            market_logger = MarketDataLogger(None, output_dir=output_dir)
+            ref = weakref.ref(market_logger)
+            market_logger.close()
+            del market_logger
+            gc.collect()
+            self.assertIsNone(ref())
+
+
+if __name__ == "__main__":
+    unittest.main()
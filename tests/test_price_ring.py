@@ -0,0 +1,73 @@
+"""
+Regression checks for how a PriceRing producer handles an existing segment of the same name.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+import subprocess
+import sys
+import unittest
+from datetime import datetime
+from multiprocessing import resource_tracker
+
+from data_handlers.price_ring import PriceRing
+
+
+class PriceRingCreateTest(unittest.TestCase):
+    """A second producer may replace a stale ring but never a live one."""
+
+    EXCHANGE = "TEST"
+    SYMBOL = "RINGCREATE"
+    SECOND_PRODUCER = (
+        "import sys\n"
+        "from data_handlers.price_ring import PriceRing\n"
+        "try:\n"
+        "    PriceRing(*sys.argv[1:], create=True)\n"
+        "except FileExistsError:\n"
+        "    print('FileExistsError')\n"
+        "reader = PriceRing(*sys.argv[1:])\n"
+        "print(reader.read_since(0)[2])\n"
+        "reader.close()\n"
+    )
+
+    def setUp(self):
+        self.rings = []
+
+    def tearDown(self):
+        for ring in self.rings:
+            ring.close()
+
+    def _create(self):
+        ring = PriceRing(self.EXCHANGE, self.SYMBOL, create=True, capacity=8)
+        self.rings.append(ring)
+        return ring
+
+    def _abandon(self, ring, pid):
+        """Detach a producer without closing the ring, as if it had been killed."""
+        ring._header[3] = pid
+        ring._header = ring._times = ring._prices = None
+        ring._shm.close()
+        resource_tracker.unregister(ring._shm._name, "shared_memory")
+        ring._shm = None
+
+    def test_live_ring_is_not_replaced(self):
+        ring = self._create()
+        ring.append(datetime(2024, 1, 5, 9, 15), 100.0)
+        # A second producer runs in its own process, as it would in production
+        second_producer = subprocess.run(
+            [sys.executable, "-c", self.SECOND_PRODUCER, self.EXCHANGE, self.SYMBOL],
+            capture_output=True, text=True, check=True)
+        self.assertEqual(second_producer.stdout.split(), ["FileExistsError", "[100.0]"])
+
+    def test_ring_of_dead_producer_is_replaced(self):
+        ring = PriceRing(self.EXCHANGE, self.SYMBOL, create=True, capacity=8)
+        ring.append(datetime(2024, 1, 5, 9, 15), 100.0)
+        dead_pid = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                                  capture_output=True, text=True, check=True).stdout
+        self._abandon(ring, int(dead_pid))
+
+        replacement = self._create()
+        self.assertEqual(replacement.read_since(0), (0, [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()